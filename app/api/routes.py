@@ -1,9 +1,20 @@
-"""HTTP routes exposed by the FastAPI application."""
+"""HTTP routes exposed by the FastAPI application.
+
+Handlers return pre-serialised responses directly so FastAPI skips
+re-validating the payload against ``response_model``; the models are still
+declared on each route to keep the OpenAPI schema accurate.
+"""
 from __future__ import annotations
 
-from typing import List
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterable, List, Type, TypeVar
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+from pydantic.json_schema import models_json_schema
 
 from ..dependencies import get_planner_service
 from ..schemas import (
@@ -23,62 +34,150 @@ from ..services.planner import PlannerService
 
 router = APIRouter(prefix="/api", tags=["planner"])
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Number of array items encoded per chunk when streaming JSON lists.
+_STREAM_BATCH_SIZE = 256
+
+# Request models parsed by hand rather than through FastAPI, which therefore
+# does not add them to the OpenAPI components; see ``add_json_body_schemas``.
+_JSON_BODY_MODELS: List[Type[BaseModel]] = []
+
+
+def _json(model: BaseModel) -> Response:
+    """Serialise an already validated model without a second validation pass.
+
+    ``model_dump_json`` writes JSON bytes straight from pydantic-core, so no
+    intermediate Python dict is built.
+    """
+
+    return Response(model.model_dump_json(), media_type="application/json")
+
+
+async def _stream_json_array(items: Iterable[Any]) -> AsyncIterator[bytes]:
+    """Encode ``items`` as a JSON array, yielding it in batches of elements."""
+
+    iterator = iter(items)
+    yield b"["
+    separator = b""
+    while batch := list(islice(iterator, _STREAM_BATCH_SIZE)):
+        yield separator + b",".join(orjson.dumps(item) for item in batch)
+        separator = b","
+    yield b"]"
+
+
+def _json_body(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Describe a manually parsed JSON request body for the OpenAPI schema."""
+
+    _JSON_BODY_MODELS.append(model)
+    schema_ref = {"$ref": f"#/components/schemas/{model.__name__}"}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema_ref}},
+        }
+    }
+
+
+def add_json_body_schemas(openapi_schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Register the models referenced by ``_json_body`` as OpenAPI components.
+
+    Nested models are hoisted alongside them so every ``$ref`` resolves within
+    the document; components FastAPI already generated are left untouched.
+    """
+
+    _, definitions = models_json_schema(
+        [(model, "validation") for model in _JSON_BODY_MODELS],
+        ref_template="#/components/schemas/{model}",
+    )
+    components = openapi_schema.setdefault("components", {}).setdefault("schemas", {})
+    for name, schema in definitions.get("$defs", {}).items():
+        components.setdefault(name, schema)
+    return openapi_schema
+
+
+async def _parse_body(request: Request, model: Type[ModelT]) -> ModelT:
+    """Validate the raw request body straight from JSON bytes.
+
+    Errors are re-raised as :class:`RequestValidationError` so clients keep
+    receiving FastAPI's usual 422 payload.
+    """
+
+    try:
+        return model.model_validate_json(await request.body())
+    except ValidationError as exc:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        raise RequestValidationError(errors) from exc
+
 
 @router.get("/health", response_model=HealthResponse, tags=["health"])
-async def health_check() -> HealthResponse:
-    return HealthResponse()
+async def health_check() -> Response:
+    return _json(HealthResponse())
 
 
-@router.post("/daily/checkin", response_model=CheckInResponse)
+@router.post(
+    "/daily/checkin",
+    response_model=CheckInResponse,
+    openapi_extra=_json_body(CheckInRequest),
+)
 async def morning_checkin(
-    payload: CheckInRequest,
+    request: Request,
     planner: PlannerService = Depends(get_planner_service),
-) -> CheckInResponse:
-    return await planner.morning_checkin(payload)
+) -> Response:
+    payload = await _parse_body(request, CheckInRequest)
+    return _json(await planner.morning_checkin(payload))
 
 
-@router.post("/daily/reflection", response_model=EveningReflectionResponse)
+@router.post(
+    "/daily/reflection",
+    response_model=EveningReflectionResponse,
+    openapi_extra=_json_body(EveningReflectionRequest),
+)
 async def evening_reflection(
-    payload: EveningReflectionRequest,
+    request: Request,
     planner: PlannerService = Depends(get_planner_service),
-) -> EveningReflectionResponse:
-    return await planner.evening_reflection(payload)
+) -> Response:
+    payload = await _parse_body(request, EveningReflectionRequest)
+    return _json(await planner.evening_reflection(payload))
 
 
 @router.post("/chat", response_model=ChatResponse)
 async def chat_with_context(
     payload: ChatMessage,
     planner: PlannerService = Depends(get_planner_service),
-) -> ChatResponse:
-    return await planner.chat(payload)
+) -> Response:
+    return _json(await planner.chat(payload))
 
 
 @router.post("/decisions", response_model=DecisionResponse)
 async def create_decision(
     payload: DecisionRequest,
     planner: PlannerService = Depends(get_planner_service),
-) -> DecisionResponse:
-    return await planner.create_decision(payload)
+) -> Response:
+    return _json(await planner.create_decision(payload))
 
 
 @router.get("/patterns/weekly", response_model=WeeklyPatternsResponse)
 async def get_weekly_patterns(
     planner: PlannerService = Depends(get_planner_service),
-) -> WeeklyPatternsResponse:
-    return await planner.weekly_patterns()
+) -> Response:
+    return _json(await planner.weekly_patterns())
 
 
 @router.post("/notion/sync", response_model=NotionSyncResponse)
 async def sync_notion_tasks(
     planner: PlannerService = Depends(get_planner_service),
-) -> NotionSyncResponse:
+) -> Response:
     tasks = await planner.sync_notion_tasks()
-    return NotionSyncResponse(tasks_synced=len(tasks), message="Tasks loaded",)
+    return _json(NotionSyncResponse(tasks_synced=len(tasks), message="Tasks loaded",))
 
 
 @router.get("/notion/tasks", response_model=List[str])
 async def list_tasks(
     planner: PlannerService = Depends(get_planner_service),
-) -> List[str]:
+) -> StreamingResponse:
     tasks = await planner.sync_notion_tasks()
-    return [task.title for task in tasks]
+    return StreamingResponse(
+        _stream_json_array(task.title for task in tasks),
+        media_type="application/json",
+    )
@@ -1,11 +1,27 @@
 """Dependency wiring for FastAPI routes."""
 from __future__ import annotations
 
-from functools import lru_cache
+from dataclasses import dataclass, field
+from datetime import date
+from functools import cached_property, lru_cache
 
 from .services.memory import MemoryService
 from .services.planner import PlannerService
-from .services.storage import InMemoryStore
+from .services.storage import DailySnapshot, InMemoryStore
+
+
+@dataclass
+class RequestContext:
+    """Per-request view of the shared store, pinned to a single calendar day."""
+
+    store: InMemoryStore
+    today: date = field(default_factory=date.today)
+
+    @cached_property
+    def snapshot(self) -> DailySnapshot:
+        """Daily read model, computed on first access and reused afterwards."""
+
+        return self.store.daily_snapshot(self.today)
 
 
 @lru_cache(maxsize=1)
@@ -18,5 +34,12 @@ def get_memory_service() -> MemoryService:
     return MemoryService()
 
 
+@lru_cache(maxsize=1)
 def get_planner_service() -> PlannerService:
     return PlannerService(get_store(), get_memory_service())
+
+
+async def get_request_context() -> RequestContext:
+    # Async, and calling get_store() directly rather than via Depends, so
+    # FastAPI resolves it inline instead of through the threadpool.
+    return RequestContext(store=get_store())
@@ -1,22 +1,55 @@
 """FastAPI application entrypoint for the personal planner prototype."""
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict
+
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
+from fastapi.staticfiles import StaticFiles
 
-from .api.routes import router as api_router
+from .api.routes import add_json_body_schemas, router as api_router
+from .dependencies import get_store
 from .ui.routes import router as ui_router
 
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Seed the shared store once per process instead of on every request."""
+
+    get_store().seed_sample_tasks()
+    yield
+
+
 app = FastAPI(
     title="Personal Planner",
     description="An opinionated personal planning assistant with persistent context.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
+app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 app.include_router(ui_router)
 app.include_router(api_router)
 
 
+_generate_openapi = app.openapi
+
+
+def openapi() -> Dict[str, Any]:
+    """Build the OpenAPI document once, including hand-parsed request bodies."""
+
+    if app.openapi_schema is None:
+        app.openapi_schema = add_json_body_schemas(_generate_openapi())
+    return app.openapi_schema
+
+
+app.openapi = openapi  # type: ignore[method-assign]
+
+
 @app.get("/", include_in_schema=False)
 async def root() -> RedirectResponse:
     """Send users to the daily planning workspace."""
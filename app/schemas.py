@@ -1,12 +1,30 @@
 """Pydantic models and enums used across the personal planner application."""
 from __future__ import annotations
 
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timezone
 from enum import Enum
 from typing import List, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+def _utcnow() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+
+    return datetime.now(timezone.utc)
+
+
+def _normalise_string_list(value):
+    """Coerce free-form input into a list of stripped, non-empty strings."""
+
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = [value]
+    if isinstance(value, (list, tuple, set)):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return value
 
 
 class GoalStatus(str, Enum):
@@ -35,7 +53,7 @@ class Goal(BaseModel):
     time_horizon: TimeHorizon = TimeHorizon.WEEKLY
     status: GoalStatus = GoalStatus.ACTIVE
     parent_goal_id: Optional[UUID] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
     completed_at: Optional[datetime] = None
 
 
@@ -48,13 +66,7 @@ class MorningContext(BaseModel):
     @field_validator("top_of_mind", "blockers", mode="before")
     @classmethod
     def _normalise_strings(cls, value):
-        if value is None:
-            return []
-        if isinstance(value, str):
-            value = [value]
-        if isinstance(value, (list, tuple, set)):
-            return [str(item).strip() for item in value if str(item).strip()]
-        return value
+        return _normalise_string_list(value)
 
 
 class EveningReflection(BaseModel):
@@ -74,11 +86,11 @@ class Decision(BaseModel):
     chosen_option: Optional[str] = None
     reasoning: Optional[str] = None
     outcome: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class PlannerEvent(BaseModel):
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     session_id: UUID
     description: str
 
@@ -103,20 +115,37 @@ class Task(BaseModel):
 # Request / response schemas -------------------------------------------------
 
 
-class CheckInRequest(BaseModel):
+class _ApiModel(BaseModel):
+    """Base class for the request and response payloads served over HTTP."""
+
+    model_config = ConfigDict(frozen=False, extra="ignore", validate_assignment=False)
+
+
+class _RequestModel(_ApiModel):
+    """Base class for inbound payloads: immutable once validated, no unknown keys."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class CheckInRequest(_RequestModel):
     energy_level: int = Field(ge=1, le=5)
     top_of_mind: List[str] = Field(default_factory=list)
     intended_focus: str
     blockers: List[str] = Field(default_factory=list)
 
+    @field_validator("top_of_mind", "blockers", mode="before")
+    @classmethod
+    def _normalise_strings(cls, value):
+        return _normalise_string_list(value)
+
 
-class CheckInResponse(BaseModel):
+class CheckInResponse(_ApiModel):
     plan: str
     tasks: List[Task]
     energy: int
 
 
-class EveningReflectionRequest(BaseModel):
+class EveningReflectionRequest(_RequestModel):
     session_date: date
     actual_focus: str
     wins: List[str] = Field(default_factory=list)
@@ -125,23 +154,23 @@ class EveningReflectionRequest(BaseModel):
     energy_pattern: List[tuple[time, int]] = Field(default_factory=list)
 
 
-class EveningReflectionResponse(BaseModel):
+class EveningReflectionResponse(_ApiModel):
     message: str
     session: DailySession
 
 
-class ChatMessage(BaseModel):
+class ChatMessage(_RequestModel):
     content: str
     include_context: bool = True
     challenge_mode: bool = False
 
 
-class ChatResponse(BaseModel):
+class ChatResponse(_ApiModel):
     reply: str
     related_memories: List[str] = Field(default_factory=list)
 
 
-class DecisionRequest(BaseModel):
+class DecisionRequest(_RequestModel):
     question: str
     context: str
     options: List[str]
@@ -149,22 +178,22 @@ class DecisionRequest(BaseModel):
     reasoning: Optional[str] = None
 
 
-class DecisionResponse(BaseModel):
+class DecisionResponse(_ApiModel):
     decision: Decision
     related_context: List[str]
 
 
-class WeeklyPatternsResponse(BaseModel):
+class WeeklyPatternsResponse(_ApiModel):
     summary: str
     highlights: List[str]
     energy_trends: List[str]
 
 
-class NotionSyncResponse(BaseModel):
+class NotionSyncResponse(_ApiModel):
     tasks_synced: int
     message: str
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(_ApiModel):
     status: str = "ok"
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
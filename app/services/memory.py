@@ -6,9 +6,25 @@ interface expected by :class:`PlannerService`.
 """
 from __future__ import annotations
 
+import re
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from datetime import date, datetime
-from typing import Dict, List
+from datetime import date, datetime, timezone
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Set
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Only the most recent interactions per session feed the daily context, and
+# search is bounded to a rolling window of the latest interactions overall.
+_CONTEXT_MEMORY_SIZE = 5
+_MAX_SEARCHABLE_MEMORIES = 10_000
+
+
+def _tokenize(text: str) -> Set[str]:
+    """Return the distinct lower-cased word tokens contained in ``text``."""
+
+    return set(_TOKEN_RE.findall(text.lower()))
 
 
 @dataclass
@@ -24,40 +40,75 @@ class MemoryRecord:
 class MemoryService:
     """Stores interactions and offers primitive search capabilities."""
 
-    def __init__(self) -> None:
-        self._sessions: Dict[str, List[MemoryRecord]] = {}
+    def __init__(self, max_records: int = _MAX_SEARCHABLE_MEMORIES) -> None:
+        self._max_records = max_records
+        self._sessions: Dict[str, Deque[MemoryRecord]] = {}
+        self._records: Dict[int, MemoryRecord] = {}
+        self._record_tokens: Dict[int, Set[str]] = {}
+        self._token_index: Dict[str, Set[int]] = defaultdict(set)
+        self._next_id = 0
 
-    async def add_interaction(self, user_input: str, ai_response: str, metadata: Dict[str, object]) -> None:
+    async def add_interaction(
+        self,
+        user_input: str,
+        ai_response: str,
+        metadata: Dict[str, object],
+        now: Optional[datetime] = None,
+    ) -> None:
         session_id = metadata.get("session_id") or metadata.get("date") or date.today().isoformat()
         record = MemoryRecord(
             user_input=user_input,
             ai_response=ai_response,
             metadata=metadata,
-            created_at=datetime.utcnow(),
+            created_at=now or datetime.now(timezone.utc),
         )
-        self._sessions.setdefault(str(session_id), []).append(record)
+        session = self._sessions.get(str(session_id))
+        if session is None:
+            session = self._sessions[str(session_id)] = deque(maxlen=_CONTEXT_MEMORY_SIZE)
+        session.append(record)
+
+        record_id = self._next_id
+        self._next_id += 1
+        tokens = _tokenize(f"{user_input} {ai_response}")
+        self._records[record_id] = record
+        self._record_tokens[record_id] = tokens
+        for token in tokens:
+            self._token_index[token].add(record_id)
+        if len(self._records) > self._max_records:
+            self._evict(next(iter(self._records)))
+
+    def _evict(self, record_id: int) -> None:
+        """Drop a record from the searchable window and the token index."""
+
+        del self._records[record_id]
+        for token in self._record_tokens.pop(record_id):
+            postings = self._token_index[token]
+            postings.discard(record_id)
+            if not postings:
+                del self._token_index[token]
 
     async def search_memories(self, query: str, limit: int = 5) -> List[str]:
-        """Return memory snippets that contain any of the query tokens."""
-
-        tokens = {token.lower() for token in query.split() if token}
-        matches: List[str] = []
-        for session in self._sessions.values():
-            for record in session:
-                haystack = f"{record.user_input} {record.ai_response}".lower()
-                if all(token in haystack for token in tokens):
-                    matches.append(record.ai_response)
-                    if len(matches) >= limit:
-                        return matches
-        return matches
+        """Return memory snippets that contain all of the query tokens.
+
+        Lookups go through an inverted index of word tokens, so the cost is
+        proportional to the number of matching records rather than the total
+        amount of stored text.
+        """
+
+        tokens = _tokenize(query)
+        if not tokens:
+            return [record.ai_response for record in islice(self._records.values(), limit)]
+        postings = sorted((self._token_index.get(token, set()) for token in tokens), key=len)
+        record_ids = set.intersection(*postings)
+        return [self._records[record_id].ai_response for record_id in sorted(record_ids)[:limit]]
 
     async def get_context_for_date(self, target_date: date) -> Dict[str, object]:
         """Return a simple payload with recent memories for the given day."""
 
         session_id = target_date.isoformat()
-        memories = self._sessions.get(session_id, [])
+        memories = self._sessions.get(session_id, ())
         return {
-            "recent_memories": [record.ai_response for record in memories[-5:]],
+            "recent_memories": [record.ai_response for record in memories],
             "date": target_date,
         }
 
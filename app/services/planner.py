@@ -1,7 +1,7 @@
 """Core business logic for the personal planner prototype."""
 from __future__ import annotations
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, timezone
 from typing import List
 
 from ..schemas import (
@@ -9,7 +9,6 @@ from ..schemas import (
     ChatResponse,
     CheckInRequest,
     CheckInResponse,
-    DailySession,
     Decision,
     DecisionRequest,
     DecisionResponse,
@@ -22,7 +21,19 @@ from ..schemas import (
     WeeklyPatternsResponse,
 )
 from .memory import MemoryService
-from .storage import InMemoryStore
+from .storage import EnergyStats, InMemoryStore
+
+# Plan line templates used by the morning check-in.
+_GREETING = "Good morning! Your energy is at {energy}/5."
+_FOCUS = "Today's focus: {focus}."
+_TOP_OF_MIND = "Top of mind: "
+_BLOCKERS = "Watch out for blockers: "
+_HIGHLIGHTS = "Recent highlights: "
+_TASKS_HEADER = "Today's tasks:\n"
+_NO_TASKS = "No scheduled tasks for today. Consider planning one meaningful step."
+
+# Weekday abbreviations indexed by ``date.weekday()``; avoids strftime("%a").
+_WEEKDAY_ABBR = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 
 
 class PlannerService:
@@ -31,53 +42,55 @@ class PlannerService:
     def __init__(self, store: InMemoryStore, memory: MemoryService) -> None:
         self.store = store
         self.memory = memory
-        self.store.seed_sample_tasks()
 
     # ------------------------------------------------------------------
     async def morning_checkin(self, payload: CheckInRequest) -> CheckInResponse:
+        now = datetime.now(timezone.utc)
         today = date.today()
+        today_iso = today.isoformat()
         context = await self.memory.get_context_for_date(today)
         tasks = self.store.get_tasks_for_date(today)
 
-        morning_context = MorningContext(**payload.dict())
-        self.store.update_morning_context(today, morning_context)
+        # The request was validated (and normalised) on the way in, so skip a
+        # second validation pass when copying it into the domain model.
+        morning_context = MorningContext.model_construct(
+            energy_level=payload.energy_level,
+            top_of_mind=payload.top_of_mind,
+            intended_focus=payload.intended_focus,
+            blockers=payload.blockers,
+        )
+        self.store.update_morning_context(today, morning_context, now=now)
 
         plan_lines: List[str] = [
-            f"Good morning! Your energy is at {payload.energy_level}/5.",
-            f"Today's focus: {payload.intended_focus}.",
+            _GREETING.format(energy=payload.energy_level),
+            _FOCUS.format(focus=payload.intended_focus),
         ]
         if payload.top_of_mind:
-            plan_lines.append(
-                "Top of mind: " + ", ".join(payload.top_of_mind)
-            )
+            plan_lines.append(_TOP_OF_MIND + ", ".join(payload.top_of_mind))
         if payload.blockers:
-            plan_lines.append(
-                "Watch out for blockers: " + ", ".join(payload.blockers)
-            )
+            plan_lines.append(_BLOCKERS + ", ".join(payload.blockers))
         if context["recent_memories"]:
-            plan_lines.append(
-                "Recent highlights: " + " | ".join(context["recent_memories"])
-            )
+            plan_lines.append(_HIGHLIGHTS + " | ".join(context["recent_memories"]))
         if tasks:
-            plan_lines.append("Today's tasks:")
-            for task in tasks:
-                plan_lines.append(f" • {task.title}")
+            plan_lines.append(_TASKS_HEADER + "\n".join(f" • {task.title}" for task in tasks))
         else:
-            plan_lines.append("No scheduled tasks for today. Consider planning one meaningful step.")
+            plan_lines.append(_NO_TASKS)
 
         plan = "\n".join(plan_lines)
 
         await self.memory.add_interaction(
             user_input=f"Morning check-in energy={payload.energy_level}",
             ai_response=plan,
-            metadata={"date": today.isoformat(), "type": "morning_checkin"},
+            metadata={"date": today_iso, "type": "morning_checkin"},
+            now=now,
         )
 
         return CheckInResponse(plan=plan, tasks=tasks, energy=payload.energy_level)
 
     # ------------------------------------------------------------------
     async def evening_reflection(self, payload: EveningReflectionRequest) -> EveningReflectionResponse:
-        reflection = EveningReflection(
+        now = datetime.now(timezone.utc)
+        reflection = EveningReflection.model_construct(
             actual_focus=payload.actual_focus,
             wins=payload.wins,
             challenges=payload.challenges,
@@ -86,6 +99,7 @@ class PlannerService:
         )
         session = self.store.update_evening_reflection(payload.session_date, reflection)
         event = PlannerEvent(
+            timestamp=now,
             session_id=session.id,
             description="Evening reflection captured",
         )
@@ -104,6 +118,7 @@ class PlannerService:
             user_input="Evening reflection submitted",
             ai_response=" ".join(message_lines),
             metadata={"date": payload.session_date.isoformat(), "type": "evening_reflection"},
+            now=now,
         )
 
         return EveningReflectionResponse(message="\n".join(message_lines), session=session)
@@ -134,7 +149,9 @@ class PlannerService:
 
     # ------------------------------------------------------------------
     async def create_decision(self, payload: DecisionRequest) -> DecisionResponse:
+        now = datetime.now(timezone.utc)
         today = date.today()
+        today_iso = today.isoformat()
         session = self.store.get_or_create_session(today)
         decision = Decision(
             session_id=session.id,
@@ -143,15 +160,18 @@ class PlannerService:
             options_considered=payload.options,
             chosen_option=payload.chosen_option,
             reasoning=payload.reasoning,
+            timestamp=now,
         )
         self.store.add_decision(today, decision)
 
+        # Search before logging: the logged interaction contains the question
+        # itself and would otherwise come back as its own related context.
         related_context = await self.memory.search_memories(payload.question)
-
         await self.memory.add_interaction(
             user_input=f"Decision: {payload.question}",
             ai_response=f"Recorded decision with {len(payload.options)} options.",
-            metadata={"type": "decision", "date": today.isoformat()},
+            metadata={"type": "decision", "date": today_iso},
+            now=now,
         )
 
         return DecisionResponse(decision=decision, related_context=related_context)
@@ -165,18 +185,20 @@ class PlannerService:
         highlights: List[str] = []
         energy_trends: List[str] = []
 
+        energy_stats = [self.store.energy_stats(session.date) for session in sessions]
+
         high_energy_days = [
-            session.date for session in sessions if session.energy_pattern and max(level for _, level in session.energy_pattern) >= 4
+            session.date for session, stats in zip(sessions, energy_stats) if stats.peak >= 4
         ]
         if high_energy_days:
             highlights.append(
-                "High energy on: " + ", ".join(day.strftime("%a") for day in high_energy_days)
+                "High energy on: " + ", ".join(_WEEKDAY_ABBR[day.weekday()] for day in high_energy_days)
             )
 
         reflection_count = sum(1 for session in sessions if session.evening_reflection)
         highlights.append(f"Captured {reflection_count} evening reflections this week.")
 
-        average_energy = self._average_energy(sessions)
+        average_energy = self._average_energy(energy_stats)
         if average_energy:
             energy_trends.append(f"Average recorded energy: {average_energy:.2f}/5")
 
@@ -201,10 +223,7 @@ class PlannerService:
 
     # ------------------------------------------------------------------
     @staticmethod
-    def _average_energy(sessions: List[DailySession]) -> float | None:
-        points: List[int] = []
-        for session in sessions:
-            points.extend(level for _, level in session.energy_pattern)
-        if not points:
-            return None
-        return sum(points) / len(points)
+    def _average_energy(energy_stats: List[EnergyStats]) -> float | None:
+        total = sum(stats.total for stats in energy_stats)
+        count = sum(stats.count for stats in energy_stats)
+        return total / count if count else None
@@ -7,10 +7,17 @@ be exercised during development and tests without external dependencies.
 """
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
-from typing import Dict, Iterable, List, Optional
+import heapq
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
+from types import MappingProxyType
+from typing import Deque, Dict, Iterable, List, Mapping, Optional, Tuple
 from uuid import UUID
 
+from sortedcontainers import SortedDict
+
 from ..schemas import (
     DailySession,
     Decision,
@@ -20,20 +27,67 @@ from ..schemas import (
     Task,
 )
 
+# Views only ever show the latest events, so older ones are not retained.
+_MAX_RECENT_EVENTS = 100
+
+
+@dataclass
+class EnergyStats:
+    """Running aggregate of the energy readings recorded for a single day."""
+
+    total: int = 0
+    count: int = 0
+    peak: int = 0
+
+    def add(self, level: int) -> None:
+        self.total += level
+        self.count += 1
+        if level > self.peak:
+            self.peak = level
+
+
+@dataclass(frozen=True, slots=True)
+class DailySnapshot:
+    """Everything the daily planner view reads from the store for one day.
+
+    Snapshots are shared between readers until the store changes. They hold
+    their own copy of the session, which the store updates in place, so a
+    snapshot never observes writes made after it was built.
+    """
+
+    session: Optional[DailySession]
+    tasks_today: Tuple[Task, ...]
+    upcoming_tasks: Tuple[Task, ...]
+    recent_events: Tuple[PlannerEvent, ...]
+    summary: Mapping[str, int]
+
 
 class InMemoryStore:
     """Holds planner data using Python data structures."""
 
     def __init__(self) -> None:
-        self._sessions: Dict[date, DailySession] = {}
-        self._events: List[PlannerEvent] = []
+        self._sessions: SortedDict[date, DailySession] = SortedDict()
+        self._events: Deque[PlannerEvent] = deque(maxlen=_MAX_RECENT_EVENTS)
+        self._event_count = 0
         self._tasks: Dict[UUID, Task] = {}
+        # Due date -> ids of the tasks due that day. Buckets are dicts used as
+        # insertion-ordered sets; undated tasks are not indexed.
+        self._task_ids_by_date: SortedDict[date, Dict[UUID, None]] = SortedDict()
+        # The due date each task is currently indexed under. Tasks may be
+        # upserted again after being mutated in place, so the index is compared
+        # against this rather than against the previously stored task.
+        self._indexed_due_dates: Dict[UUID, date] = {}
+        self._energy_stats: Dict[date, EnergyStats] = {}
+        # Bumped on every mutation so readers can cache derived views.
+        self.version = 0
+        self._snapshot: Optional[Tuple[Tuple[int, date, int], DailySnapshot]] = None
 
     # ------------------------------------------------------------------
     # Session handling
     def get_or_create_session(self, session_date: date) -> DailySession:
         if session_date not in self._sessions:
             self._sessions[session_date] = DailySession(date=session_date)
+            self.version += 1
         return self._sessions[session_date]
 
     def get_session(self, session_date: date) -> Optional[DailySession]:
@@ -41,11 +95,16 @@ class InMemoryStore:
 
         return self._sessions.get(session_date)
 
-    def update_morning_context(self, session_date: date, context: MorningContext) -> DailySession:
+    def update_morning_context(
+        self, session_date: date, context: MorningContext, now: Optional[datetime] = None
+    ) -> DailySession:
         session = self.get_or_create_session(session_date)
         session.morning_context = context
-        session.energy_pattern.append((datetime.utcnow().time(), context.energy_level))
+        recorded_at = now or datetime.now(timezone.utc)
+        session.energy_pattern.append((recorded_at.time(), context.energy_level))
+        self._record_energy(session_date, [context.energy_level])
         self._sessions[session_date] = session
+        self.version += 1
         return session
 
     def update_evening_reflection(
@@ -55,53 +114,119 @@ class InMemoryStore:
         session.evening_reflection = reflection
         if reflection.energy_pattern:
             session.energy_pattern.extend(reflection.energy_pattern)
+            self._record_energy(session_date, [level for _, level in reflection.energy_pattern])
         self._sessions[session_date] = session
+        self.version += 1
         return session
 
     def add_decision(self, session_date: date, decision: Decision) -> DailySession:
         session = self.get_or_create_session(session_date)
         session.decisions.append(decision)
         self._sessions[session_date] = session
+        self.version += 1
         return session
 
     def get_sessions_between(self, start: date, end: date) -> Iterable[DailySession]:
-        for session_date, session in self._sessions.items():
-            if start <= session_date <= end:
-                yield session
+        """Yield sessions dated within ``[start, end]`` in chronological order."""
+
+        for session_date in self._sessions.irange(start, end):
+            yield self._sessions[session_date]
+
+    def energy_stats(self, session_date: date) -> EnergyStats:
+        """Return the energy aggregate for a day (empty if nothing was recorded)."""
+
+        return self._energy_stats.get(session_date) or EnergyStats()
+
+    def _record_energy(self, session_date: date, levels: Iterable[int]) -> None:
+        stats = self._energy_stats.setdefault(session_date, EnergyStats())
+        for level in levels:
+            stats.add(level)
 
     def list_sessions(self) -> List[DailySession]:
         """Return all sessions ordered by date (newest first)."""
 
-        return sorted(self._sessions.values(), key=lambda session: session.date, reverse=True)
+        return list(reversed(self._sessions.values()))
 
     # ------------------------------------------------------------------
     # Tasks handling
     def upsert_tasks(self, tasks: Iterable[Task]) -> None:
         for task in tasks:
             self._tasks[task.id] = task
+            self._reindex_task(task)
+        self.version += 1
 
     def get_tasks_for_date(self, target_date: date) -> List[Task]:
-        return [task for task in self._tasks.values() if task.due_date == target_date]
+        return [self._tasks[task_id] for task_id in self._task_ids_by_date.get(target_date, ())]
 
     def get_all_tasks(self) -> List[Task]:
         return list(self._tasks.values())
 
+    def upcoming_tasks(self, after: date, limit: int = 5) -> List[Task]:
+        """Return up to ``limit`` tasks due after ``after``, soonest first."""
+
+        upcoming = (
+            self._tasks[task_id]
+            for due_date in self._task_ids_by_date.irange(minimum=after, inclusive=(False, True))
+            for task_id in self._task_ids_by_date[due_date]
+        )
+        return list(islice(upcoming, limit))
+
+    def _reindex_task(self, task: Task) -> None:
+        """Move ``task`` to the index bucket for its current due date."""
+
+        previous_due = self._indexed_due_dates.get(task.id)
+        if previous_due == task.due_date:
+            return
+        if previous_due is not None:
+            bucket = self._task_ids_by_date[previous_due]
+            del bucket[task.id]
+            if not bucket:
+                del self._task_ids_by_date[previous_due]
+            del self._indexed_due_dates[task.id]
+        if task.due_date is not None:
+            self._task_ids_by_date.setdefault(task.due_date, {})[task.id] = None
+            self._indexed_due_dates[task.id] = task.due_date
+
     # ------------------------------------------------------------------
     # Events
     def add_event(self, event: PlannerEvent) -> None:
         self._events.append(event)
+        self._event_count += 1
+        self.version += 1
 
     def recent_events(self, limit: int = 10) -> List[PlannerEvent]:
-        return list(self._events[-limit:])
+        return list(islice(self._events, max(len(self._events) - limit, 0), None))
 
     def recent_decisions(self, limit: int = 5) -> List[Decision]:
         """Return the most recent decisions across all sessions."""
 
-        decisions: List[Decision] = []
-        for session in self.list_sessions():
-            decisions.extend(session.decisions)
-        decisions.sort(key=lambda decision: decision.timestamp, reverse=True)
-        return decisions[:limit]
+        decisions = (decision for session in self._sessions.values() for decision in session.decisions)
+        return heapq.nlargest(limit, decisions, key=lambda decision: decision.timestamp)
+
+    # ------------------------------------------------------------------
+    # Read models
+    def daily_snapshot(self, today: date, upcoming_limit: int = 5) -> DailySnapshot:
+        """Collect the data rendered by the daily planner in a single call.
+
+        The snapshot is published per store version, so readers share it until
+        the next mutation instead of recomputing it.
+        """
+
+        key = (self.version, today, upcoming_limit)
+        if self._snapshot is not None and self._snapshot[0] == key:
+            return self._snapshot[1]
+        # Sessions are updated in place, so publish a copy that later writes
+        # cannot reach.
+        session = self._sessions.get(today)
+        snapshot = DailySnapshot(
+            session=session.model_copy(deep=True) if session is not None else None,
+            tasks_today=tuple(self.get_tasks_for_date(today)),
+            upcoming_tasks=tuple(self.upcoming_tasks(today, upcoming_limit)),
+            recent_events=tuple(self.recent_events()),
+            summary=MappingProxyType(self.summary()),
+        )
+        self._snapshot = (key, snapshot)
+        return snapshot
 
     # ------------------------------------------------------------------
     # Convenience helpers
@@ -119,6 +244,6 @@ class InMemoryStore:
     def summary(self) -> Dict[str, int]:
         return {
             "sessions": len(self._sessions),
-            "events": len(self._events),
+            "events": self._event_count,
             "tasks": len(self._tasks),
         }
@@ -0,0 +1,64 @@
+"""Parsers for the free-text fields submitted by the planner forms.
+
+These helpers are pure, fully typed string functions with no FastAPI
+dependencies, so they can be tested or compiled independently of the routes.
+"""
+from __future__ import annotations
+
+import re
+from datetime import time
+from functools import lru_cache
+from typing import List, Tuple
+
+# A list item: text between commas/line breaks, trimmed of surrounding whitespace.
+_ITEM_RE = re.compile(r"[^,\r\n\s](?:[^,\r\n]*[^,\r\n\s])?")
+# Only carriage returns and line feeds end a line; ``str.splitlines`` would
+# also break on form feeds, vertical tabs and Unicode separators.
+_LINE_BREAK_RE = re.compile(r"\r\n|\r|\n")
+# An energy entry: ``HH:MM`` then a level, separated by whitespace, ``=`` or ``-``.
+# The hour and minute use ``strptime``'s own ``%H``/``%M`` patterns, and the
+# level accepts what ``int()`` does, including a ``+`` sign and underscores.
+_ENERGY_RE = re.compile(
+    r"[\s=\-]*(2[0-3]|[0-1]\d|\d):([0-5]\d|\d)[\s=\-]+(\+?\d+(?:_\d+)*)(?![^\s=\-])"
+)
+
+
+def split_input(value: str) -> Tuple[str, ...]:
+    """Split comma or newline separated text into a tuple of cleaned items.
+
+    Results are cached and shared between calls, hence immutable; blank input
+    short-circuits to the empty tuple without touching the cache.
+    """
+
+    if not value:
+        return ()
+    return _split_input_cached(value)
+
+
+@lru_cache(maxsize=256)
+def _split_input_cached(value: str) -> Tuple[str, ...]:
+    return tuple(_ITEM_RE.findall(value))
+
+
+def parse_energy_pattern(raw: str) -> Tuple[tuple[time, int], ...]:
+    """Parse energy entries in the ``HH:MM LEVEL`` format.
+
+    Like :func:`split_input`, results are cached, shared tuples.
+    """
+
+    if not raw:
+        return ()
+    return _parse_energy_pattern_cached(raw)
+
+
+@lru_cache(maxsize=256)
+def _parse_energy_pattern_cached(raw: str) -> Tuple[tuple[time, int], ...]:
+    entries: List[tuple[time, int]] = []
+    for line in _LINE_BREAK_RE.split(raw):
+        match = _ENERGY_RE.match(line)
+        if not match:
+            continue
+        level = int(match[3])
+        if 1 <= level <= 5:
+            entries.append((time(int(match[1]), int(match[2])), level))
+    return tuple(entries)
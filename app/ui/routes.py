@@ -1,68 +1,61 @@
 """HTML UI routes for the personal planner prototype."""
 from __future__ import annotations
 
-from datetime import date, datetime, time, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict
+from uuid import uuid4
 
 from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 
-from ..dependencies import get_planner_service, get_store
+from ..dependencies import RequestContext, get_planner_service, get_request_context
 from ..schemas import CheckInRequest, DecisionRequest, EveningReflectionRequest
 from ..services.planner import PlannerService
 from ..services.storage import InMemoryStore
+from .forms import parse_energy_pattern, split_input
 
 TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
 templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+# Templates ship with the application, so skip the per-render mtime check.
+# Restart the server to pick up template edits.
+templates.env.auto_reload = False
 
 router = APIRouter()
 
+# The in-memory store restarts at version 0 on every boot, so ETags also carry
+# a per-process seed to stop clients revalidating against a previous run.
+_ETAG_SEED = uuid4().hex[:12]
 
-def _split_input(value: str) -> List[str]:
-    """Split comma or newline separated text into a cleaned list."""
-
-    if not value:
-        return []
-    tokens: List[str] = []
-    for line in value.replace("\r", "\n").split("\n"):
-        for part in line.split(","):
-            item = part.strip()
-            if item:
-                tokens.append(item)
-    return tokens
-
-
-def _parse_energy_pattern(raw: str) -> List[tuple[time, int]]:
-    """Parse energy entries in the ``HH:MM LEVEL`` format."""
-
-    entries: List[tuple[time, int]] = []
-    if not raw:
-        return entries
-    for line in raw.replace("\r", "\n").split("\n"):
-        cleaned = line.strip()
-        if not cleaned:
-            continue
-        cleaned = cleaned.replace("=", " ").replace("-", " ")
-        parts = [part for part in cleaned.split() if part]
-        if len(parts) < 2:
-            continue
-        time_part, level_part = parts[0], parts[1]
-        try:
-            parsed_time = datetime.strptime(time_part, "%H:%M").time()
-            level = int(level_part)
-        except ValueError:
-            continue
-        if 1 <= level <= 5:
-            entries.append((parsed_time, level))
-    return entries
+
+def _is_htmx(request: Request) -> bool:
+    """Return whether the request was issued by htmx and expects a fragment."""
+
+    return "hx-request" in request.headers
+
+
+def _page_etag(ctx: RequestContext) -> str:
+    """Weak ETag for pages derived purely from the store and today's date."""
+
+    return f'W/"{_ETAG_SEED}-{ctx.store.version}-{ctx.today.toordinal()}"'
+
+
+def _cache_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """Return whether the client's ``If-None-Match`` already names ``etag``."""
+
+    if_none_match = request.headers.get("if-none-match")
+    return bool(if_none_match) and etag in (tag.strip() for tag in if_none_match.split(","))
 
 
 def _base_daily_context(
-    request: Request,
-    store: InMemoryStore,
-    today: date,
+    request: Request | None,
+    ctx: RequestContext,
     *,
     checkin_result=None,
     reflection_result=None,
@@ -71,39 +64,77 @@ def _base_daily_context(
 ) -> Dict[str, object]:
     """Build the template context shared by the daily planner views."""
 
-    session = store.get_session(today)
-    tasks_today = store.get_tasks_for_date(today)
-    upcoming_tasks = [
-        task
-        for task in store.get_all_tasks()
-        if task.due_date and task.due_date > today
-    ][:5]
+    snapshot = ctx.snapshot
 
     return {
         "request": request,
-        "today": today,
-        "session": session,
-        "tasks_today": tasks_today,
-        "upcoming_tasks": upcoming_tasks,
-        "events": store.recent_events(),
+        "today": ctx.today,
+        "session": snapshot.session,
+        "tasks_today": snapshot.tasks_today,
+        "upcoming_tasks": snapshot.upcoming_tasks,
+        "events": snapshot.recent_events,
         "checkin_result": checkin_result,
         "reflection_result": reflection_result,
         "form_state": form_state or {"energy_level": "3"},
         "evening_form_state": evening_form_state or {},
-        "store_summary": store.summary(),
+        "store_summary": snapshot.summary,
+    }
+
+
+def _daily_update(
+    request: Request,
+    ctx: RequestContext,
+    result_template: str,
+    **results: object,
+) -> HTMLResponse:
+    """Render an htmx response for a daily form submission.
+
+    ``result_template`` fills the form's target, while the context, recap and
+    summary panels are re-rendered with ``hx-swap-oob`` so they reflect the
+    write just made.
+    """
+
+    context = _base_daily_context(request, ctx, **results)
+    context.update(result_template=result_template, oob=True)
+    return templates.TemplateResponse("_daily_update.html", context)
+
+
+@lru_cache(maxsize=64)
+def _render_daily(store: InMemoryStore, version: int, today: date) -> bytes:
+    """Render the daily page without any submitted form state.
+
+    ``version`` is only part of the cache key: every store mutation bumps it,
+    so a cached page is reused until the data behind it changes.
+    """
+
+    context = _base_daily_context(None, RequestContext(store=store, today=today))
+    return templates.get_template("daily.html").render(context).encode()
+
+
+@lru_cache(maxsize=64)
+def _render_decide(store: InMemoryStore, version: int) -> bytes:
+    """Render the empty decision workspace; cached per store ``version``."""
+
+    context = {
+        "decision_result": None,
+        "recent_decisions": store.recent_decisions(),
+        "form_state": {"options": ""},
     }
+    return templates.get_template("decide.html").render(context).encode()
 
 
 @router.get("/daily", response_class=HTMLResponse)
 async def daily_planner(
     request: Request,
-    store: InMemoryStore = Depends(get_store),
-) -> HTMLResponse:
+    ctx: RequestContext = Depends(get_request_context),
+) -> Response:
     """Render the combined morning and evening planning workflows."""
 
-    today = date.today()
-    context = _base_daily_context(request, store, today)
-    return templates.TemplateResponse("daily.html", context)
+    etag = _page_etag(ctx)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=_cache_headers(etag))
+    content = _render_daily(ctx.store, ctx.store.version, ctx.today)
+    return HTMLResponse(content=content, headers=_cache_headers(etag))
 
 
 @router.post("/daily/morning", response_class=HTMLResponse)
@@ -114,17 +145,21 @@ async def submit_morning_checkin(
     top_of_mind: str = Form(""),
     blockers: str = Form(""),
     planner: PlannerService = Depends(get_planner_service),
-    store: InMemoryStore = Depends(get_store),
+    ctx: RequestContext = Depends(get_request_context),
 ) -> HTMLResponse:
     """Handle the morning check-in form submission."""
 
     payload = CheckInRequest(
         energy_level=energy_level,
         intended_focus=intended_focus,
-        top_of_mind=_split_input(top_of_mind),
-        blockers=_split_input(blockers),
+        top_of_mind=split_input(top_of_mind),
+        blockers=split_input(blockers),
     )
     checkin_result = await planner.morning_checkin(payload)
+    if _is_htmx(request):
+        return _daily_update(
+            request, ctx, "_daily_checkin_result.html", checkin_result=checkin_result
+        )
 
     form_state = {
         "energy_level": str(energy_level),
@@ -132,11 +167,9 @@ async def submit_morning_checkin(
         "top_of_mind": top_of_mind,
         "blockers": blockers,
     }
-    today = date.today()
     context = _base_daily_context(
         request,
-        store,
-        today,
+        ctx,
         checkin_result=checkin_result,
         form_state=form_state,
     )
@@ -153,26 +186,29 @@ async def submit_evening_reflection(
     tomorrow_intent: str = Form(...),
     energy_pattern: str = Form(""),
     planner: PlannerService = Depends(get_planner_service),
-    store: InMemoryStore = Depends(get_store),
+    ctx: RequestContext = Depends(get_request_context),
 ) -> HTMLResponse:
     """Capture the evening reflection flow."""
 
     try:
         target_date = date.fromisoformat(session_date)
     except ValueError:
-        target_date = date.today()
+        target_date = ctx.today
 
     payload = EveningReflectionRequest(
         session_date=target_date,
         actual_focus=actual_focus,
-        wins=_split_input(wins),
-        challenges=_split_input(challenges),
+        wins=split_input(wins),
+        challenges=split_input(challenges),
         tomorrow_intent=tomorrow_intent,
-        energy_pattern=_parse_energy_pattern(energy_pattern),
+        energy_pattern=parse_energy_pattern(energy_pattern),
     )
     reflection_result = await planner.evening_reflection(payload)
+    if _is_htmx(request):
+        return _daily_update(
+            request, ctx, "_daily_reflection_result.html", reflection_result=reflection_result
+        )
 
-    today = date.today()
     evening_form_state = {
         "session_date": target_date.isoformat(),
         "actual_focus": actual_focus,
@@ -183,8 +219,7 @@ async def submit_evening_reflection(
     }
     context = _base_daily_context(
         request,
-        store,
-        today,
+        ctx,
         reflection_result=reflection_result,
         evening_form_state=evening_form_state,
     )
@@ -194,17 +229,15 @@ async def submit_evening_reflection(
 @router.get("/decide", response_class=HTMLResponse)
 async def decision_helper(
     request: Request,
-    store: InMemoryStore = Depends(get_store),
-) -> HTMLResponse:
+    ctx: RequestContext = Depends(get_request_context),
+) -> Response:
     """Render the decision capture workspace."""
 
-    context = {
-        "request": request,
-        "decision_result": None,
-        "recent_decisions": store.recent_decisions(),
-        "form_state": {"options": ""},
-    }
-    return templates.TemplateResponse("decide.html", context)
+    etag = _page_etag(ctx)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=_cache_headers(etag))
+    content = _render_decide(ctx.store, ctx.store.version)
+    return HTMLResponse(content=content, headers=_cache_headers(etag))
 
 
 @router.post("/decide", response_class=HTMLResponse)
@@ -216,14 +249,14 @@ async def submit_decision(
     chosen_option: str = Form(""),
     reasoning: str = Form(""),
     planner: PlannerService = Depends(get_planner_service),
-    store: InMemoryStore = Depends(get_store),
+    ctx: RequestContext = Depends(get_request_context),
 ) -> HTMLResponse:
     """Persist a decision and surface contextual insights."""
 
     payload = DecisionRequest(
         question=question,
         context=context_text,
-        options=_split_input(options),
+        options=split_input(options),
         chosen_option=chosen_option or None,
         reasoning=reasoning or None,
     )
@@ -240,7 +273,7 @@ async def submit_decision(
     context = {
         "request": request,
         "decision_result": decision_result,
-        "recent_decisions": store.recent_decisions(),
+        "recent_decisions": ctx.store.recent_decisions(),
         "form_state": form_state,
     }
     return templates.TemplateResponse("decide.html", context)
@@ -250,16 +283,20 @@ async def submit_decision(
 async def weekly_review(
     request: Request,
     planner: PlannerService = Depends(get_planner_service),
-    store: InMemoryStore = Depends(get_store),
-) -> HTMLResponse:
+    ctx: RequestContext = Depends(get_request_context),
+) -> Response:
     """Present the pattern review dashboard."""
 
+    etag = _page_etag(ctx)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=_cache_headers(etag))
+
     patterns = await planner.weekly_patterns()
-    today = date.today()
-    window_start = today - timedelta(days=6)
-    sessions = [
-        session for session in store.list_sessions() if window_start <= session.date <= today
-    ]
+    store = ctx.store
+    window_start = ctx.today - timedelta(days=6)
+    # Only the trailing week is shown, so read that range off the date index
+    # (newest first) rather than walking the whole session history.
+    sessions = list(store.get_sessions_between(window_start, ctx.today))[::-1]
 
     context = {
         "request": request,
@@ -268,4 +305,4 @@ async def weekly_review(
         "events": store.recent_events(limit=20),
         "summary": store.summary(),
     }
-    return templates.TemplateResponse("review.html", context)
+    return templates.TemplateResponse("review.html", context, headers=_cache_headers(etag))
@@ -0,0 +1,121 @@
+"""Property-based checks for the free-text form parsers."""
+from __future__ import annotations
+
+from datetime import datetime, time
+from typing import List, Tuple
+
+from hypothesis import example, given
+from hypothesis import strategies as st
+
+from app.ui.forms import parse_energy_pattern, split_input
+
+
+def _reference_split(value: str) -> List[str]:
+    """The original split/strip/filter implementation ``split_input`` replaced."""
+
+    if not value:
+        return []
+    tokens: List[str] = []
+    for line in value.replace("\r", "\n").split("\n"):
+        for part in line.split(","):
+            item = part.strip()
+            if item:
+                tokens.append(item)
+    return tokens
+
+
+_WHITESPACE = st.sampled_from([" ", "\t", "\x0b", "\x0c", "\xa0", "\u2003"])
+_ITEMS = st.lists(st.text(alphabet="abc xyz-_.", min_size=0, max_size=8), max_size=6)
+
+
+def _padded(item: str, padding: st.DataObject) -> str:
+    left = padding.draw(st.lists(_WHITESPACE, max_size=3))
+    right = padding.draw(st.lists(_WHITESPACE, max_size=3))
+    return "".join(left) + item + "".join(right)
+
+
+@given(_ITEMS)
+def test_commas_only(items: List[str]) -> None:
+    value = ",".join(items)
+    assert split_input(value) == tuple(_reference_split(value))
+
+
+@given(_ITEMS, st.sampled_from(["\n", "\r", "\r\n"]))
+def test_newlines_only(items: List[str], newline: str) -> None:
+    value = newline.join(items)
+    assert split_input(value) == tuple(_reference_split(value))
+
+
+@given(_ITEMS, st.data())
+def test_mixed_separators(items: List[str], data: st.DataObject) -> None:
+    separator = st.sampled_from([",", "\n", "\r", "\r\n", ",\n", ",,"])
+    separators = data.draw(st.lists(separator, min_size=len(items), max_size=len(items)))
+    value = "".join(item + separator for item, separator in zip(items, separators))
+    assert split_input(value) == tuple(_reference_split(value))
+
+
+@given(_ITEMS, st.data())
+def test_surrounding_whitespace(items: List[str], data: st.DataObject) -> None:
+    value = ",\n".join(_padded(item, data) for item in items)
+    assert split_input(value) == tuple(_reference_split(value))
+
+
+@given(st.text(alphabet=st.characters(codec="utf-8")))
+def test_arbitrary_text(value: str) -> None:
+    assert split_input(value) == tuple(_reference_split(value))
+
+
+def _reference_energy_pattern(raw: str) -> List[Tuple[time, int]]:
+    """The original strip/split/strptime parser ``parse_energy_pattern`` replaced."""
+
+    entries: List[Tuple[time, int]] = []
+    if not raw:
+        return entries
+    for line in raw.replace("\r", "\n").split("\n"):
+        cleaned = line.strip()
+        if not cleaned:
+            continue
+        cleaned = cleaned.replace("=", " ").replace("-", " ")
+        parts = [part for part in cleaned.split() if part]
+        if len(parts) < 2:
+            continue
+        time_part, level_part = parts[0], parts[1]
+        try:
+            parsed_time = datetime.strptime(time_part, "%H:%M").time()
+            level = int(level_part)
+        except ValueError:
+            continue
+        if 1 <= level <= 5:
+            entries.append((parsed_time, level))
+    return entries
+
+
+_ENERGY_TIMES = st.one_of(
+    st.builds("{}:{}".format, st.integers(0, 30), st.integers(0, 70)),
+    st.builds("{:02d}:{:02d}".format, st.integers(0, 30), st.integers(0, 70)),
+    # Malformed times, and non-ASCII digits where strptime does and does not take them.
+    st.sampled_from(["009:00", "09:00:00", "9:", ":30", "ab:cd"]),
+    st.sampled_from(["\u0663:3\u0663", "12:3\u0663", "11:\u06631"]),
+)
+_ENERGY_LEVELS = st.one_of(
+    st.integers(-2, 8).map(str),
+    st.sampled_from(["+3", "0_3", "03", "3_", "_3", "++3", "3.0", "\u0663", "x"]),
+)
+_ENERGY_SEPARATORS = st.sampled_from([" ", "\t", "=", "-", " = ", "--", "=-", "\x0b", "\u2028", ""])
+_ENERGY_LINES = st.tuples(
+    _ENERGY_SEPARATORS, _ENERGY_TIMES, _ENERGY_SEPARATORS, _ENERGY_LEVELS, _ENERGY_SEPARATORS
+).map("".join)
+
+
+@given(st.lists(_ENERGY_LINES, max_size=5), st.sampled_from(["\n", "\r", "\r\n"]))
+@example(["09:00 +3", "10:15=0_3", "11:30 - 4"], "\n")
+@example(["24:00 3", "9:60 3", "23:59 6", "00:00 0"], "\r\n")
+@example(["09:00\x0b4", "13:30\x0b5=", "11:\u06631 2"], "\r")
+def test_energy_pattern_lines(lines: List[str], newline: str) -> None:
+    raw = newline.join(lines)
+    assert parse_energy_pattern(raw) == tuple(_reference_energy_pattern(raw))
+
+
+@given(st.text(alphabet="0123456789:=-+_ \t\r\n\x0b\x0c\x1c\x85\u2028\xa0a\u0663"))
+def test_energy_pattern_arbitrary_text(raw: str) -> None:
+    assert parse_energy_pattern(raw) == tuple(_reference_energy_pattern(raw))